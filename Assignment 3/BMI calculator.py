@@ -9,6 +9,7 @@ It follows Python coding standards:
 
 POUNDS_TO_KG = 0.45359237
 INCHES_TO_METERS = 0.0254
+BMI_CONST = POUNDS_TO_KG / (INCHES_TO_METERS * INCHES_TO_METERS)
 
 
 def calculate_bmi(weight_pounds, height_inches):
@@ -22,10 +23,7 @@ def calculate_bmi(weight_pounds, height_inches):
     Returns:
         float: Calculated BMI value
     """
-    weight_kg = weight_pounds * POUNDS_TO_KG
-    height_m = height_inches * INCHES_TO_METERS
-    bmi = weight_kg / (height_m ** 2)
-    return bmi
+    return BMI_CONST * weight_pounds / (height_inches * height_inches)
 
 
 def main():
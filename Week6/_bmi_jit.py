@@ -0,0 +1,20 @@
+"""Numba kernels for bmi.calculate_bmi_batch, imported on first use."""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True, error_model="numpy")
+def calculate_bmi_jit(weight, height):
+    return (weight / (height * height)) * 703.0
+
+
+@njit(parallel=True, cache=True)
+def calculate_bmi_batch_jit(weights, heights):
+    bmi = np.empty(weights.shape[0])
+    for i in prange(weights.shape[0]):
+        if weights[i] > 0 and heights[i] > 0:
+            bmi[i] = calculate_bmi_jit(weights[i], heights[i])
+        else:
+            bmi[i] = np.nan
+    return bmi
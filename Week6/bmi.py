@@ -1,22 +1,90 @@
+from bisect import bisect_right
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for batch calculations
+    np = None
+
+# Category upper bounds; a BMI equal to a bound falls into the next category.
+_THRESHOLDS = (18.5, 25.0, 30.0)
+_LABELS = ("Underweight", "Normal weight", "Overweight", "Obese")
+
+
+@lru_cache(maxsize=None)
+def _load_batch_kernel():
+    """Import the Numba batch kernel on first use; None if Numba is missing."""
+    try:
+        from _bmi_jit import calculate_bmi_batch_jit
+    except ImportError:  # Numba is optional; batches fall back to plain NumPy
+        return None
+    return calculate_bmi_batch_jit
+
+
 def calculate_bmi(weight, height):
+    if np is not None and (isinstance(weight, np.ndarray) or isinstance(height, np.ndarray)):
+        return calculate_bmi_batch(weight, height)
+    return _calculate_bmi_scalar(weight, height)
+
+
+# BMI is a pure function of its inputs, so repeated (weight, height) pairs are
+# served from the cache. Arrays are unhashable and go to the batch path instead.
+@lru_cache(maxsize=4096)
+def _calculate_bmi_scalar(weight, height):
     if height <= 0:
         raise ValueError("Height must be greater than zero.")
     if weight <= 0:
         raise ValueError("Weight must be greater than zero.")
 
-    bmi = (weight / (height ** 2)) * 703
+    bmi = (weight / (height * height)) * 703
     return round(bmi, 2)
 
 
-def bmi_category(bmi):
-    if bmi < 18.5:
-        return "Underweight"
-    elif bmi < 25:
-        return "Normal weight"
-    elif bmi < 30:
-        return "Overweight"
+def calculate_bmi_batch(weights, heights):
+    """Calculate BMI for arrays of weights (lbs) and heights (inches).
+
+    Entries with a zero or negative weight or height give NaN instead of
+    raising, so one bad record does not stop the whole batch.
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    heights = np.asarray(heights, dtype=np.float64)
+
+    kernel = _load_batch_kernel()
+    if kernel is not None:
+        weights, heights = np.broadcast_arrays(weights, heights)
+        # flatten() copies, so the kernel never sees a read-only broadcast view.
+        bmi = kernel(weights.flatten(), heights.flatten()).reshape(weights.shape)
     else:
-        return "Obese"
+        bmi = np.full(np.broadcast_shapes(weights.shape, heights.shape), np.nan)
+        valid = (weights > 0) & (heights > 0)
+        np.divide(weights, heights * heights, out=bmi, where=valid)
+        np.multiply(bmi, 703, out=bmi)
+    return _round_like_scalar(bmi)
+
+
+def _round_like_scalar(bmi):
+    """Round a BMI array in place to 2 decimals, matching round(bmi, 2).
+
+    np.round scales by 100 first, which can tip values sitting on a
+    half-cent the other way; those few are re-rounded with round().
+    """
+    scaled = bmi * 100
+    with np.errstate(invalid="ignore"):  # inf/NaN entries are never near half
+        near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    # tolist() gives Python floats; round() on np.float64 would use np.round.
+    exact = [round(value, 2) for value in bmi[near_half].tolist()]
+    np.round(bmi, 2, out=bmi)
+    bmi[near_half] = exact
+    return bmi
+
+
+def bmi_category(bmi):
+    return _LABELS[bisect_right(_THRESHOLDS, bmi)]
+
+
+def bmi_category_batch(bmis):
+    """Classify an array of BMI values in one vectorized lookup."""
+    return np.asarray(_LABELS)[np.searchsorted(_THRESHOLDS, bmis, side="right")]
 
 
 # Optional interactive run
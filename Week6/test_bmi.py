@@ -1,5 +1,6 @@
+import math
 import unittest
-from bmi import calculate_bmi, bmi_category
+from bmi import calculate_bmi, calculate_bmi_batch, bmi_category, bmi_category_batch, np
 
 
 class TestBMI(unittest.TestCase):
@@ -27,6 +28,28 @@ class TestBMI(unittest.TestCase):
         with self.assertRaises(ValueError):
             calculate_bmi(-120, 65)
 
+    # Test 6 — Batch calculation matches the scalar results
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_batch_bmi(self):
+        bmis = calculate_bmi_batch([150, 100, 150], [65, 68, 0])
+        self.assertAlmostEqual(bmis[0], calculate_bmi(150, 65), places=2)
+        self.assertAlmostEqual(bmis[1], calculate_bmi(100, 68), places=2)
+        self.assertTrue(math.isnan(bmis[2]))
+
+    # Test 7 — Half-cent ties round the same way in scalar and batch paths
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_batch_matches_scalar_on_ties(self):
+        self.assertEqual(calculate_bmi(352, 80), 38.66)
+        self.assertEqual(calculate_bmi_batch([352, 342], [80, 76]).tolist(),
+                         [calculate_bmi(352, 80), calculate_bmi(342, 76)])
+
+    # Test 8 — Batch categories match the scalar boundaries
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_batch_category(self):
+        bmis = [18.49, 18.5, 24.99, 25, 30]
+        self.assertEqual(list(bmi_category_batch(bmis)), [bmi_category(b) for b in bmis])
+        self.assertEqual(bmi_category(18.5), "Normal weight")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,15 +1,51 @@
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for batch calculations
+    np = None
+
 POUNDS_TO_KG = 0.45359237
 INCHES_TO_METERS = 0.0254
+BMI_CONST = POUNDS_TO_KG / (INCHES_TO_METERS * INCHES_TO_METERS)
 
 
 def calculate_bmi(weight_pounds, height_inches):
-    weight_kg = weight_pounds * POUNDS_TO_KG
-    height_m = height_inches * INCHES_TO_METERS
-    return weight_kg / (height_m ** 2)
+    if np is not None and (
+        isinstance(weight_pounds, np.ndarray) or isinstance(height_inches, np.ndarray)
+    ):
+        return calculate_bmi_batch(weight_pounds, height_inches)
+    return BMI_CONST * weight_pounds / (height_inches * height_inches)
+
+
+def calculate_bmi_batch(weights_pounds, heights_inches):
+    """Calculate BMI for arrays of weights and heights (NaN where height <= 0)."""
+    weights = np.asarray(weights_pounds, dtype=np.float64) * BMI_CONST
+    heights = np.asarray(heights_inches, dtype=np.float64)
+
+    bmi = np.full(np.broadcast_shapes(weights.shape, heights.shape), np.nan)
+    np.divide(weights, heights * heights, out=bmi, where=heights > 0)
+    return bmi
+
+
+def run_batch():
+    """Read "weight_pounds height_inches" lines from stdin and print each BMI."""
+    if np is None:
+        sys.exit("Batch mode needs NumPy installed.")
+    lines = sys.stdin.read().splitlines()
+    if not any(line.strip() for line in lines):
+        return
+    data = np.loadtxt(lines, dtype=np.float64, ndmin=2)
+    bmis = calculate_bmi_batch(data[:, 0], data[:, 1])
+    np.savetxt(sys.stdout, bmis, fmt="%.2f")
 
 
 def main():
-    """Run the BMI calculator program with a loop."""
+    """Run the BMI calculator program with a loop (or --batch from stdin)."""
+    if "--batch" in sys.argv[1:]:
+        run_batch()
+        return
+
     while True:
         weight_pounds = float(input("Enter your weight in pounds: "))
         height_feet = int(input("Enter your height (feet): "))
@@ -20,8 +56,8 @@ def main():
 
         print(f"Your BMI is {bmi:.2f}")
 
-        choice = input("Do you want to calculate another BMI? (Y/N): ").strip().lower()
-        if choice != "y":
+        choice = input("Do you want to calculate another BMI? (Y/N): ").strip()
+        if choice not in ("y", "Y"):
             print("Goodbye!")
             break
 
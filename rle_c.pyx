@@ -0,0 +1,112 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Session 7 - Run-Length Encoding (RLE), compiled hot loops
+
+Cython versions of encode_rle and decode_rle from rle.py. They follow the
+same '##00' format, escape rules and error messages, but walk the string as
+C-level Py_UCS4 characters instead of going through the interpreter.
+
+Build in place with:  cythonize -i rle_c.pyx
+rle.py picks these up automatically when the compiled module is importable
+and keeps its pure-Python versions otherwise.
+
+Author: Sophia Marotti
+"""
+
+ENCODED_PREFIX = "##00"
+
+
+cdef inline _append_run(list out_parts, Py_UCS4 ch, Py_ssize_t count):
+    """Append one escaped run leader and its count (if 2+) to out_parts."""
+    if ch == u"#":
+        out_parts.append("##")
+    elif ch.isdigit():
+        out_parts.append("#")
+        out_parts.append(ch)
+    else:
+        out_parts.append(ch)
+    if count > 1:
+        out_parts.append(str(count))
+
+
+cpdef str encode_rle(raw):
+    """Encode a raw string into '##00' prefixed RLE format with escape support."""
+    if not isinstance(raw, str):
+        raise TypeError(f"raw must be a str, got {type(raw).__name__}.")
+
+    cdef str s = raw
+    cdef Py_ssize_t n = len(s)
+    cdef Py_ssize_t i
+    cdef Py_ssize_t count = 1
+    cdef Py_UCS4 ch, prev
+
+    if n == 0:
+        # Still mark as encoded; empty payload.
+        return ENCODED_PREFIX
+
+    out_parts = [ENCODED_PREFIX]
+    prev = s[0]
+
+    for i in range(1, n):
+        ch = s[i]
+        if ch == prev:
+            count += 1
+        else:
+            _append_run(out_parts, prev, count)
+            prev = ch
+            count = 1
+
+    # finalize last run
+    _append_run(out_parts, prev, count)
+
+    return "".join(out_parts)
+
+
+cpdef str decode_rle(encoded):
+    """Decode a string that is in the '##00' prefixed RLE format with escapes."""
+    if not isinstance(encoded, str):
+        raise TypeError(f"encoded must be a str, got {type(encoded).__name__}.")
+    if not encoded.startswith(ENCODED_PREFIX):
+        raise ValueError("Encoded string must start with '##00'.")
+
+    cdef str payload = encoded[len(ENCODED_PREFIX):]
+    cdef Py_ssize_t n = len(payload)
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t j
+    cdef Py_UCS4 ch
+
+    out_parts = []
+
+    while i < n:
+        ch = payload[i]
+        if ch == u"#":
+            if i + 1 >= n:
+                raise ValueError("Dangling '#' at end of encoded data.")
+            ch = payload[i + 1]
+            if ch != u"#" and not ch.isdigit():
+                raise ValueError(f"Invalid escape sequence '#{ch}' in encoded data.")
+            i += 2
+        elif ch.isdigit():
+            raise ValueError(
+                "Invalid encoded data: digit appeared where a character was expected "
+                "(digits must be escaped with '#')."
+            )
+        else:
+            i += 1
+
+        # Read optional count (one or more digits)
+        j = i
+        while j < n and payload[j].isdigit():
+            j += 1
+
+        if j == i:
+            out_parts.append(ch)
+        else:
+            # int() keeps Python's rules for odd digits and very large counts.
+            count = int(payload[i:j])
+            if count <= 0:
+                raise ValueError("Count must be a positive integer.")
+            out_parts.append(ch * count)
+            i = j
+
+    return "".join(out_parts)
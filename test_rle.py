@@ -0,0 +1,82 @@
+import unittest
+from rle import (
+    decode_legacy_rle,
+    decode_rle,
+    decode_rle_checked,
+    encode_rle,
+    encode_rle_checked,
+    is_probably_encoded,
+)
+
+
+class TestRLE(unittest.TestCase):
+
+    # Test 1 — Compressed counts on ASCII input
+    def test_encode_ascii(self):
+        self.assertEqual(encode_rle("AAABCC"), "##00A3BC2")
+        self.assertEqual(encode_rle(""), "##00")
+
+    # Test 2 — '#' and digits are escaped
+    def test_encode_escapes(self):
+        self.assertEqual(encode_rle("A2"), "##00A#2")
+        self.assertEqual(encode_rle("##"), "##00##2")
+        self.assertEqual(encode_rle("1112"), "##00#13#2")
+
+    # Test 3 — Round trips through the ASCII paths
+    def test_round_trip_ascii(self):
+        for raw in ["AAABCC", "A2", "##00", "x#1#1yyyy0000000000z", "a\nb\n\n"]:
+            self.assertEqual(decode_rle(encode_rle(raw)), raw)
+
+    # Test 4 — Round trips through the non-ASCII paths (including Unicode digits)
+    def test_round_trip_non_ascii(self):
+        for raw in ["ééé€", "aé22##", "²²x٣٣٣"]:
+            self.assertEqual(decode_rle(encode_rle(raw)), raw)
+        self.assertEqual(encode_rle("²²"), "##00#²2")
+
+    # Test 5 — Decoding escapes and counts
+    def test_decode_escapes(self):
+        self.assertEqual(decode_rle("##00A3BC2"), "AAABCC")
+        self.assertEqual(decode_rle("##00##2#13"), "##111")
+        self.assertEqual(decode_rle("##00"), "")
+
+    # Test 6 — Failed conditions while decoding
+    def test_decode_errors(self):
+        for encoded in [
+            "A3",  # missing prefix
+            "##00A#",  # dangling '#'
+            "##00#x",  # bad escape
+            "##00#é",  # bad escape (non-ASCII path)
+            "##003",  # unescaped digit
+            "##00é²",  # unescaped Unicode digit
+            "##00A0",  # zero count
+        ]:
+            with self.assertRaises(ValueError, msg=encoded):
+                decode_rle(encoded)
+
+    # Test 7 — Legacy (no prefix) decoding
+    def test_decode_legacy(self):
+        self.assertEqual(decode_legacy_rle("A3BC2"), "AAABCC")
+        self.assertEqual(decode_legacy_rle(""), "")
+        for s in ["3A", "A0", "A²"]:
+            with self.assertRaises(ValueError, msg=s):
+                decode_legacy_rle(s)
+
+    # Test 8 — Choosing between encode and decode
+    def test_is_probably_encoded(self):
+        self.assertTrue(is_probably_encoded("##00AB"))
+        self.assertTrue(is_probably_encoded("A3"))
+        self.assertTrue(is_probably_encoded("é²"))
+        self.assertFalse(is_probably_encoded("ABé"))
+
+    # Test 9 — Checked wrappers always validate their argument
+    def test_checked_wrappers(self):
+        self.assertEqual(encode_rle_checked("AAB"), "##00A2B")
+        self.assertEqual(decode_rle_checked("##00A2B"), "AAB")
+        with self.assertRaises(TypeError):
+            encode_rle_checked(5)
+        with self.assertRaises(TypeError):
+            decode_rle_checked(None)
+
+
+if __name__ == "__main__":
+    unittest.main()